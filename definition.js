@@ -13,6 +13,7 @@ Blockly.Blocks['scan_card'] = {
 
 Blockly.Python['scan_card'] = function(block) {
   Blockly.Python.definitions_['import_rfid'] = 'from rfid import *';
+  Blockly.Python.definitions_['init_rfid'] = 'rfid = make_default_rfid()';
   var code = 'rfid.scan_card()';
   return [code, Blockly.Python.ORDER_ATOMIC];
 };
@@ -47,6 +48,7 @@ Blockly.Blocks['scan_and_check'] = {
 Blockly.Python['scan_and_check'] = function(block) {
   var list_name = block.getFieldValue('list_name');
   Blockly.Python.definitions_['import_rfid'] = 'from rfid import *'; 
+  Blockly.Python.definitions_['init_rfid'] = 'rfid = make_default_rfid()';
   var code = `rfid.scan_and_check("rfids_${list_name}")`;
   return [code, Blockly.Python.ORDER_ATOMIC];
 };
@@ -81,6 +83,7 @@ Blockly.Blocks['scan_and_add_card'] = {
 Blockly.Python['scan_and_add_card'] = function(block) {
   var list_name = block.getFieldValue('list_name');
   Blockly.Python.definitions_['import_rfid'] = 'from rfid import *'; 
+  Blockly.Python.definitions_['init_rfid'] = 'rfid = make_default_rfid()';
   var code = code = `rfid.scan_and_add_card("rfids_${list_name}")\n`;
   return code;
 };
@@ -115,6 +118,7 @@ Blockly.Blocks['scan_and_remove_card'] = {
 Blockly.Python['scan_and_remove_card'] = function(block) {
   var list_name = block.getFieldValue('list_name');
   Blockly.Python.definitions_['import_rfid'] = 'from rfid import *'; 
+  Blockly.Python.definitions_['init_rfid'] = 'rfid = make_default_rfid()';
   var code = `rfid.scan_and_remove_card("rfids_${list_name}")\n`;
   return code;
 };
@@ -149,6 +153,7 @@ Blockly.Blocks['clear_list'] = {
 Blockly.Python['clear_list'] = function(block) {
   var list_name = block.getFieldValue('list_name');
   Blockly.Python.definitions_['import_rfid'] = 'from rfid import *'; 
+  Blockly.Python.definitions_['init_rfid'] = 'rfid = make_default_rfid()';
   var code = `rfid.clear_list("rfids_${list_name}")\n`;
   return code;
 };
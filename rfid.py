@@ -8,11 +8,16 @@ This address needs to match the RFID Module pad:
 
 from yolobit import *
 import json
+import binascii
 from time import sleep, sleep_ms
 from rfid_expansion import *
 import os
 import uos
-from machine import SoftI2C, Pin
+from machine import I2C, SoftI2C, Pin
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
 
 _SYSNAME = os.uname().sysname
 
@@ -56,17 +61,72 @@ _TAG_CMD_ANTCOL3 = 0x97
 
 # Classic
 _TAG_AUTH_KEY_A = 0x60
-_CLASSIC_KEY = [0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]
+_CLASSIC_KEY = b'\xff\xff\xff\xff\xff\xff'
+
+# ISO/IEC 14443-3 CRC_A: reflected polynomial 0x8408, preset 0x6363, sent LSB first
+_CRC_A_PRESET = 0x6363
+_CRC_A_TABLE = (
+    0x0000, 0x1189, 0x2312, 0x329B, 0x4624, 0x57AD, 0x6536, 0x74BF,
+    0x8C48, 0x9DC1, 0xAF5A, 0xBED3, 0xCA6C, 0xDBE5, 0xE97E, 0xF8F7,
+    0x1081, 0x0108, 0x3393, 0x221A, 0x56A5, 0x472C, 0x75B7, 0x643E,
+    0x9CC9, 0x8D40, 0xBFDB, 0xAE52, 0xDAED, 0xCB64, 0xF9FF, 0xE876,
+    0x2102, 0x308B, 0x0210, 0x1399, 0x6726, 0x76AF, 0x4434, 0x55BD,
+    0xAD4A, 0xBCC3, 0x8E58, 0x9FD1, 0xEB6E, 0xFAE7, 0xC87C, 0xD9F5,
+    0x3183, 0x200A, 0x1291, 0x0318, 0x77A7, 0x662E, 0x54B5, 0x453C,
+    0xBDCB, 0xAC42, 0x9ED9, 0x8F50, 0xFBEF, 0xEA66, 0xD8FD, 0xC974,
+    0x4204, 0x538D, 0x6116, 0x709F, 0x0420, 0x15A9, 0x2732, 0x36BB,
+    0xCE4C, 0xDFC5, 0xED5E, 0xFCD7, 0x8868, 0x99E1, 0xAB7A, 0xBAF3,
+    0x5285, 0x430C, 0x7197, 0x601E, 0x14A1, 0x0528, 0x37B3, 0x263A,
+    0xDECD, 0xCF44, 0xFDDF, 0xEC56, 0x98E9, 0x8960, 0xBBFB, 0xAA72,
+    0x6306, 0x728F, 0x4014, 0x519D, 0x2522, 0x34AB, 0x0630, 0x17B9,
+    0xEF4E, 0xFEC7, 0xCC5C, 0xDDD5, 0xA96A, 0xB8E3, 0x8A78, 0x9BF1,
+    0x7387, 0x620E, 0x5095, 0x411C, 0x35A3, 0x242A, 0x16B1, 0x0738,
+    0xFFCF, 0xEE46, 0xDCDD, 0xCD54, 0xB9EB, 0xA862, 0x9AF9, 0x8B70,
+    0x8408, 0x9581, 0xA71A, 0xB693, 0xC22C, 0xD3A5, 0xE13E, 0xF0B7,
+    0x0840, 0x19C9, 0x2B52, 0x3ADB, 0x4E64, 0x5FED, 0x6D76, 0x7CFF,
+    0x9489, 0x8500, 0xB79B, 0xA612, 0xD2AD, 0xC324, 0xF1BF, 0xE036,
+    0x18C1, 0x0948, 0x3BD3, 0x2A5A, 0x5EE5, 0x4F6C, 0x7DF7, 0x6C7E,
+    0xA50A, 0xB483, 0x8618, 0x9791, 0xE32E, 0xF2A7, 0xC03C, 0xD1B5,
+    0x2942, 0x38CB, 0x0A50, 0x1BD9, 0x6F66, 0x7EEF, 0x4C74, 0x5DFD,
+    0xB58B, 0xA402, 0x9699, 0x8710, 0xF3AF, 0xE226, 0xD0BD, 0xC134,
+    0x39C3, 0x284A, 0x1AD1, 0x0B58, 0x7FE7, 0x6E6E, 0x5CF5, 0x4D7C,
+    0xC60C, 0xD785, 0xE51E, 0xF497, 0x8028, 0x91A1, 0xA33A, 0xB2B3,
+    0x4A44, 0x5BCD, 0x6956, 0x78DF, 0x0C60, 0x1DE9, 0x2F72, 0x3EFB,
+    0xD68D, 0xC704, 0xF59F, 0xE416, 0x90A9, 0x8120, 0xB3BB, 0xA232,
+    0x5AC5, 0x4B4C, 0x79D7, 0x685E, 0x1CE1, 0x0D68, 0x3FF3, 0x2E7A,
+    0xE70E, 0xF687, 0xC41C, 0xD595, 0xA12A, 0xB0A3, 0x8238, 0x93B1,
+    0x6B46, 0x7ACF, 0x4854, 0x59DD, 0x2D62, 0x3CEB, 0x0E70, 0x1FF9,
+    0xF78F, 0xE606, 0xD49D, 0xC514, 0xB1AB, 0xA022, 0x92B9, 0x8330,
+    0x7BC7, 0x6A4E, 0x58D5, 0x495C, 0x3DE3, 0x2C6A, 0x1EF1, 0x0F78,
+)
+
+# Delay in ms before each COM_IRQ poll while waiting for the tag. The first polls run back to back, since a
+# reply usually lands within a few I2C reads, then they back off to 1 ms apart. The 40 slow polls cost at least
+# 40 ms plus their I2C reads, but the module's own 25 ms TimerIRq normally ends the wait well before that.
+_POLL_DELAYS_MS = (0,) * 10 + (1,) * 40
+
+# Settle time after the soft reset that recovers a stuck module
+_RESET_SETTLE_MS = 5
+
+# Registers only ever changed by this driver, so a cached copy of the last written value is safe to use
+_SHADOW_REGS = (_REG_BIT_FRAMING, _REG_TX_CONTROL)
 
 class RFID:
     OK = 1
     NOTAGERR = 2
     ERR = 3
 
-    def __init__(self, i2c, address=_I2C_ADDRESS, asw=None, suppress_warnings=False):
+    def __init__(self, i2c, address=_I2C_ADDRESS, asw=None, suppress_warnings=False, use_hw_crc=False, flush_every=1, irq_pin=None):
 
         self.i2c = i2c
+        self._use_hw_crc = use_hw_crc # compute CRC_A on the module's co-processor (for validation)
         self.lists = {}
+        self._members = {} # list_name -> (list it mirrors, set of its cards), see _members_of()
+        self._dirty = {} # list_name -> number of changes not yet written to flash
+        self._flush_every = flush_every # write a list back after this many changes, see flush()
+        self._irq = Pin(irq_pin, Pin.IN) if irq_pin is not None else None # module IRQ output, saves polling COM_IRQ
+        self._shadow = {}
+        self._lock = asyncio.Lock() # one tag read at a time through the *_async API, see readTagID_async()
         
         if type(asw) is list: # determine address from ASW switch positions (if provided)
             assert max(asw) <= 1 and min(asw) >= 0 and len(asw) is 2, "asw must be a list of 1/0, length=2"
@@ -75,9 +135,16 @@ class RFID:
             self.address = address # fall back on using address argument
             
         self._tag_present = False
+        self._antenna_on = False
         self._read_tag_id_success = False
         self.reset()
         sleep_ms(50)
+        self._reinit_regs()
+        if _SYSNAME == 'microbit' and not suppress_warnings:
+            print("Due to micro:bit's limited flash storage this library is running with reduced features.\nFor advanced features, use a Raspberry Pi or Pico instead.\nSuppress this warning: initialise with PiicoDev_RFID(suppress_warnings=True)\n")
+    
+    # Programs the timer, modulation and IRQ routing after a soft reset
+    def _reinit_regs(self):
         self._wreg(_REG_T_MODE, 0x80)
         self._wreg(_REG_T_PRESCALER, 0xA9)
         self._wreg(_REG_T_RELOAD_HI, 0x03)
@@ -85,39 +152,47 @@ class RFID:
         self._wreg(_REG_TX_ASK, 0x40)
         self._wreg(_REG_MODE, 0x3D)
         self._wreg(_REG_DIV_I_EN, 0x80) # CMOS Logic for IRQ pin
-        self._wreg(_REG_COM_I_EN, 0x20) # allows the receiver interrupt request (RxIRq bit) to be propagated to pin IRQ
+        if self._irq is None:
+            self._wreg(_REG_COM_I_EN, 0x20) # allows the receiver interrupt request (RxIRq bit) to be propagated to pin IRQ
+        else:
+            self._wreg(_REG_COM_I_EN, 0x31) # RxIRq, IdleIRq (authentication done) and TimerIRq (no tag) drive pin IRQ
         self.antennaOn()
-        if _SYSNAME == 'microbit' and not suppress_warnings:
-            print("Due to micro:bit's limited flash storage this library is running with reduced features.\nFor advanced features, use a Raspberry Pi or Pico instead.\nSuppress this warning: initialise with PiicoDev_RFID(suppress_warnings=True)\n")
-    
+
     # I2C write to register
     def _wreg(self, reg, val):
         self.i2c.writeto_mem(self.address, reg, bytes([val]))
+        if reg in _SHADOW_REGS:
+            self._shadow[reg] = val
 
     # I2C write to FIFO buffer
     def _wfifo(self, reg, val):
-        self.i2c.writeto_mem(self.address, reg, bytes(val))
+        self.i2c.writeto_mem(self.address, reg, val if isinstance(val, (bytes, bytearray)) else bytes(val))
 
     # I2C read from register
     def _rreg(self, reg):
         val = self.i2c.readfrom_mem(self.address, reg, 1)
         return val[0]
     
+    # Last written value of a shadowed register, read over I2C otherwise
+    def _rshadow(self, reg):
+        if reg in self._shadow:
+            return self._shadow[reg]
+        return self._rreg(reg)
+
     # Set register flags
     def _sflags(self, reg, mask):
-        current_value = self._rreg(reg)
-        self._wreg(reg, current_value | mask)
+        if reg == _REG_FIFO_LEVEL: # FlushBuffer self-clears and the level bits are read-only
+            self._wreg(reg, mask)
+            return
+        self._wreg(reg, self._rshadow(reg) | mask)
 
     # Clear register flags
     def _cflags(self, reg, mask):
-        self._wreg(reg, self._rreg(reg) & (~mask))
-
-    # Communicates with the tag
-    def _tocard(self, cmd, send):
-        recv = []
-        bits = irq_en = wait_irq = n = 0
-        stat = self.ERR
+        self._wreg(reg, self._rshadow(reg) & (~mask))
 
+    # Loads the FIFO and starts cmd, returns the (irq_en, wait_irq) masks for the wait
+    def _tocard_start(self, cmd, send):
+        irq_en = wait_irq = 0
         if cmd == _CMD_MF_AUTHENT:
             irq_en = 0x12
             wait_irq = 0x10
@@ -133,51 +208,96 @@ class RFID:
         self._wreg(_REG_COMMAND, cmd)
         if cmd == _CMD_TRANCEIVE:
             self._sflags(_REG_BIT_FRAMING, 0x80) # This starts the transceive operation
+        return irq_en, wait_irq
 
-        i = 20000  #2000
-        while True:
+    # Checks once whether cmd has finished, returns the COM_IRQ bits if so, otherwise None
+    def _tocard_poll(self, wait_irq):
+        if self._irq is None or self._irq.value(): # with the IRQ pin wired, only touch the bus once it fires
             n = self._rreg(_REG_COM_IRQ)
-            i -= 1
-            if n & wait_irq:
-                break
-            if n & 0x01:
-                break
-            if i == 0:
-                break
+            if n & (wait_irq | 0x01):
+                return n
+        return None
+
+    # Collects the outcome of cmd once the module has signalled completion
+    def _tocard_finish(self, cmd, irq_en, n):
+        recv = []
+        bits = 0
+        stat = self.ERR
         self._cflags(_REG_BIT_FRAMING, 0x80)
         
-        if i:
-            if (self._rreg(_REG_ERROR) & 0x1B) == 0x00:
-                stat = self.OK
-
-                if n & irq_en & 0x01:
-                    stat = self.NOTAGERR
-                elif cmd == _CMD_TRANCEIVE:
-                    n = self._rreg(_REG_FIFO_LEVEL)
-                    lbits = self._rreg(_REG_CONTROL) & 0x07
-                    if lbits != 0:
-                        bits = (n - 1) * 8 + lbits
-                    else:
-                        bits = n * 8
-                    if n == 0:
-                        n = 1
-                    elif n > 16:
-                        n = 16
-
-                    for _ in range(n):
-                        recv.append(self._rreg(_REG_FIFO_DATA))
-            else:
-                stat = self.ERR
+        if (self._rreg(_REG_ERROR) & 0x1B) == 0x00:
+            stat = self.OK
+
+            if n & irq_en & 0x01:
+                stat = self.NOTAGERR
+            elif cmd == _CMD_TRANCEIVE:
+                n = self._rreg(_REG_FIFO_LEVEL)
+                lbits = self._rreg(_REG_CONTROL) & 0x07
+                if lbits != 0:
+                    bits = (n - 1) * 8 + lbits
+                else:
+                    bits = n * 8
+                if n == 0:
+                    n = 1
+                elif n > 16:
+                    n = 16
+
+                recv = list(self.i2c.readfrom_mem(self.address, _REG_FIFO_DATA, n)) # FIFO drains in a single burst
         return stat, recv, bits
 
-    # Use the co-processor on the RFID module to obtain CRC
+    # Soft-resets a stuck module and programs it again, yielding the ms the caller must wait in between
+    def _recover(self):
+        self.reset()
+        yield _RESET_SETTLE_MS
+        self._reinit_regs()
+
+    # Communicates with the tag
+    def _tocard(self, cmd, send):
+        irq_en, wait_irq = self._tocard_start(cmd, send)
+        n = None
+        for ms in _POLL_DELAYS_MS:
+            if ms:
+                sleep_ms(ms)  # back off instead of hammering the bus
+            n = self._tocard_poll(wait_irq)
+            if n is not None:
+                break
+        if n is None: # not even the module's own timer fired, so it is stuck: start it over
+            for ms in self._recover():
+                sleep_ms(ms)
+            return self.ERR, [], 0
+        return self._tocard_finish(cmd, irq_en, n)
+
+    # Same as _tocard, but yields to other tasks while waiting for the tag
+    async def _tocard_async(self, cmd, send):
+        irq_en, wait_irq = self._tocard_start(cmd, send)
+        n = None
+        for ms in _POLL_DELAYS_MS:
+            if ms:
+                await asyncio.sleep_ms(ms)
+            n = self._tocard_poll(wait_irq)
+            if n is not None:
+                break
+        if n is None:
+            for ms in self._recover():
+                await asyncio.sleep_ms(ms)
+            return self.ERR, [], 0
+        return self._tocard_finish(cmd, irq_en, n)
+
+    # Obtain the CRC_A of data, LSB first
     def _crc(self, data):
+        if self._use_hw_crc:
+            return self._hwcrc(data)
+        crc = _CRC_A_PRESET
+        for b in data:
+            crc = (crc >> 8) ^ _CRC_A_TABLE[(crc ^ b) & 0xFF]
+        return [crc & 0xFF, (crc >> 8) & 0xFF]
+
+    # Use the co-processor on the RFID module to obtain CRC
+    def _hwcrc(self, data):
         self._wreg(_REG_COMMAND, _CMD_IDLE)
         self._cflags(_REG_DIV_IRQ, 0x04)
         self._sflags(_REG_FIFO_LEVEL, 0x80)
-
-        for c in data:
-            self._wreg(_REG_FIFO_DATA, c)
+        self._wfifo(_REG_FIFO_DATA, data)
         self._wreg(_REG_COMMAND, _CMD_CALC_CRC)
 
         i = 0xFF
@@ -197,17 +317,23 @@ class RFID:
             stat = self.ERR
         return stat, bits
 
+    # Same as _request, but yields to other tasks while waiting for the tag
+    async def _request_async(self, mode):
+        self._wreg(_REG_BIT_FRAMING, 0x07)
+        (stat, recv, bits) = await self._tocard_async(_CMD_TRANCEIVE, [mode])
+        if (stat != self.OK) | (bits != 0x10):
+            stat = self.ERR
+        return stat, bits
+
     # Perform anticollision check
     def _anticoll(self, anticolN=_TAG_CMD_ANTCOL1):
-        ser_chk = 0
         ser = [anticolN, 0x20]
 
         self._wreg(_REG_BIT_FRAMING, 0x00)
         (stat, recv, bits) = self._tocard(_CMD_TRANCEIVE, ser)
         if stat == self.OK:
             if len(recv) == 5:
-                for i in range(4):
-                    ser_chk = ser_chk ^ recv[i]
+                ser_chk = recv[0] ^ recv[1] ^ recv[2] ^ recv[3] # BCC
                 if ser_chk != recv[4]:
                     stat = self.ERR
             else:
@@ -217,14 +343,12 @@ class RFID:
     # Select the desired tag
     def _selectTag(self, serNum,anticolN):
         backData = []
-        buf = []
-        buf.append(anticolN)
-        buf.append(0x70)
-        for i in serNum:
-            buf.append(i)
-        pOut = self._crc(buf)
-        buf.append(pOut[0])
-        buf.append(pOut[1])
+        n = len(serNum)
+        buf = bytearray(n + 4) # SEL, NVB, UID + BCC, CRC_A
+        buf[0] = anticolN
+        buf[1] = 0x70
+        buf[2:2 + n] = bytes(serNum)
+        buf[-2:] = bytes(self._crc(memoryview(buf)[:-2]))
         (status, backData, backLen) = self._tocard( 0x0C, buf)
         if (status == self.OK) and (backLen == 0x18):
             return  1
@@ -257,14 +381,15 @@ class RFID:
                 if status != self.OK:
                     return result
         valid_uid.extend(uid[0:5])
-        id_formatted = ''
         id = valid_uid[:len(valid_uid)-1]
-        for i in range(0,len(id)):
-            if i > 0:
-                id_formatted = id_formatted + ':'
-            if id[i] < 16:
-                id_formatted = id_formatted + '0'
-            id_formatted = id_formatted + hex(id[i])[2:]
+        try:
+            id_formatted = binascii.hexlify(bytes(id), ':').decode()
+        except TypeError: # firmware without the separator argument
+            id_formatted = ''
+            for i in range(0,len(id)):
+                if i > 0:
+                    id_formatted = id_formatted + ':'
+                id_formatted = id_formatted + '%02x' % id[i]
         type = 'ntag'
         if len(id) == 4:
             type = 'classic'
@@ -278,27 +403,55 @@ class RFID:
             _present = True
         self._tag_present = _present
         return {'present':_present, 'ATQA':ATQA}
+
+    # Same as _detectTag, but yields to other tasks while waiting for the tag
+    async def _detectTag_async(self):
+        (stat, ATQA) = await self._request_async(_TAG_CMD_REQIDL)
+        _present = stat is self.OK
+        self._tag_present = _present
+        return {'present':_present, 'ATQA':ATQA}
     
     # Resets the RFID module
     def reset(self):
         self._wreg(_REG_COMMAND, _CMD_SOFT_RESET)
+        self._shadow = {} # registers are back to their power-on defaults
+        self._antenna_on = False
 
     # Turns the antenna on
     def antennaOn(self):
-        if ~(self._rreg(_REG_TX_CONTROL) & 0x03):
-            self._sflags(_REG_TX_CONTROL, 0x83)
+        if self._antenna_on:
+            return
+        self._sflags(_REG_TX_CONTROL, 0x83)
+        self._antenna_on = True
     
     # Turns the antenna off
     def antennaOff(self):
-        if not (~(self._rreg(_REG_TX_CONTROL) & 0x03)):
-            self._cflags(_REG_TX_CONTROL, b'\x03')
+        if not self._antenna_on:
+            return
+        self._cflags(_REG_TX_CONTROL, 0x03)
+        self._antenna_on = False
 
     # Stand-alone function that puts the tag into the correct state
     # Returns detailed information about the tag
     def readTagID(self):
+        if self._lock.locked(): # an async read is suspended mid-transceive, touching the module now corrupts it
+            raise RuntimeError("RFID reader is busy with an async read")
         detect_tag_result = self._detectTag()
         if detect_tag_result['present'] is False: #Try again, the card may not be in the correct state
             detect_tag_result = self._detectTag()
+        return self._readDetectedTagID(detect_tag_result)
+
+    # Same as readTagID, but yields to other tasks while no tag has answered yet.
+    # Concurrent async reads queue on self._lock, a sync read during one raises RuntimeError.
+    async def readTagID_async(self):
+        async with self._lock:
+            detect_tag_result = await self._detectTag_async()
+            if detect_tag_result['present'] is False: #Try again, the card may not be in the correct state
+                detect_tag_result = await self._detectTag_async()
+            return self._readDetectedTagID(detect_tag_result)
+
+    # Reads the tag found by _detectTag/_detectTag_async
+    def _readDetectedTagID(self, detect_tag_result):
         if detect_tag_result['present']:
             read_tag_id_result = self._readTagID()
             if read_tag_id_result['success']:
@@ -330,6 +483,8 @@ class RFID:
             data = []
         
         self.lists[list_name] = data  
+        self._members[list_name] = (data, set(data))
+        self._dirty.pop(list_name, None)
         return data  
 
     def save_list(self, list_name):
@@ -337,12 +492,37 @@ class RFID:
             filename = f"{list_name}.json"
             with open(filename, "w") as f:
                 json.dump(self.lists[list_name], f)
+            self._dirty.pop(list_name, None)
+
+    # Set of the cards in self.lists[list_name] for O(1) membership checks,
+    # rebuilt if the list is new, was replaced, or changed size outside this class
+    def _members_of(self, list_name):
+        cards = self.lists[list_name]
+        entry = self._members.get(list_name)
+        if entry is None or entry[0] is not cards or len(entry[1]) != len(cards):
+            entry = (cards, set(cards))
+            self._members[list_name] = entry
+        return entry[1]
+
+    # Count a change to the list and write it back once enough have accumulated
+    def _mark_dirty(self, list_name):
+        self._dirty[list_name] = self._dirty.get(list_name, 0) + 1
+        if self._dirty[list_name] >= self._flush_every:
+            self.save_list(list_name)
+
+    # Writes every list with pending changes to flash
+    def flush(self):
+        for list_name in list(self._dirty):
+            self.save_list(list_name)
 
     def scan_card(self):
         if self.tagPresent():
             return self.readID()
         return ""
 
+    async def scan_card_async(self):
+        return (await self.readTagID_async())['id_formatted']
+
     def scan_and_add_card(self, list_name):
         if list_name not in self.lists:
             self.load_list(list_name) 
@@ -351,9 +531,11 @@ class RFID:
         if not uuid:
             return
 
-        if uuid not in self.lists[list_name]:  
+        members = self._members_of(list_name)
+        if uuid not in members:  
+            members.add(uuid)
             self.lists[list_name].append(uuid)
-            self.save_list(list_name) 
+            self._mark_dirty(list_name) 
             print("Add card success!") 
 
     def scan_and_check(self, list_name):
@@ -364,19 +546,31 @@ class RFID:
         if not uuid:
             return False
         
-        return uuid in self.lists[list_name]
+        return uuid in self._members_of(list_name)
+
+    async def scan_and_check_async(self, list_name):
+        if list_name not in self.lists:
+            self.load_list(list_name)  
+
+        uuid = await self.scan_card_async()
+        if not uuid:
+            return False
+        
+        return uuid in self._members_of(list_name)
 
     def get_list(self, list_name):
         if list_name not in self.lists:
             self.load_list(list_name)  
-        return self.lists.get(list_name, [])
+        return list(self.lists.get(list_name, ()))
 
     def scan_and_remove_card(self, list_name):
         if list_name not in self.lists:
             self.load_list(list_name)  
 
         uuid = self.scan_card()
-        if uuid in self.lists[list_name]:  
+        members = self._members_of(list_name)
+        if uuid in members:  
+            members.discard(uuid)
             self.lists[list_name].remove(uuid)
 
             if not self.lists[list_name]:  
@@ -387,19 +581,40 @@ class RFID:
                     pass  
 
                 del self.lists[list_name]  
+                self._members.pop(list_name, None)
+                self._dirty.pop(list_name, None)
             else:
-                self.save_list(list_name)
+                self._mark_dirty(list_name)
                 print("Remove card success!")  
             
     def clear_list(self, list_name):
         filename = f"{list_name}.json"
         if list_name in self.lists:
             del self.lists[list_name]
+        self._members.pop(list_name, None)
+        self._dirty.pop(list_name, None)
         try:
             uos.remove(filename)
             print("Remove list success!")
         except OSError:
             pass  
 
-i2c = SoftI2C(scl=pin19.pin, sda=pin20.pin, freq=100000)
-rfid = RFID(i2c)
\ No newline at end of file
+# Creates an RFID reader on the Yolo:Bit's I2C pins, other keyword arguments go to RFID()
+def make_default_rfid(scl=pin19.pin, sda=pin20.pin, freq=400000, **kwargs):
+    try: # hardware peripheral at the MFRC522's 400 kHz fast mode
+        i2c = I2C(0, scl=scl, sda=sda, freq=freq)
+    except (ValueError, TypeError, OSError): # no hardware I2C on this port, bit-bang instead
+        i2c = SoftI2C(scl=scl, sda=sda, freq=freq)
+    return RFID(i2c, **kwargs)
+
+_default_rfid = None
+
+# Deprecated: the module used to create `rfid` on import, keep `from rfid import rfid` working
+def __getattr__(name):
+    global _default_rfid
+    if name == 'rfid':
+        if _default_rfid is None:
+            print("rfid.rfid is deprecated, use rfid = make_default_rfid() instead")
+            _default_rfid = make_default_rfid()
+        return _default_rfid
+    raise AttributeError(name)
@@ -17,7 +17,7 @@ _NTAG_PAGE_ADR_MAX = 39
 
 # Classic
 _TAG_AUTH_KEY_A = 0x60
-_CLASSIC_KEY = [0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]
+_CLASSIC_KEY = b'\xff\xff\xff\xff\xff\xff'
 _CLASSIC_NO_BYTES_PER_REG = 16
 _CLASSIC_ADR = [1, 2, 4, 5, 6, 8, 9, 10, 12, 13, 14, 16, 17, 18, 20, 21, 22, 24, 25, 26, 28, 29, 30, 32, 33, 34, 36, 37, 38, 40, 41, 42, 44, 45, 46, 48]
 
@@ -34,7 +34,7 @@ def _classicSelectTag(self, ser):
 
 # Required for Classic Tag only - Authenticate the address in memory
 def _classicAuth(self, mode, addr, sect, ser):
-    return self._tocard(_CMD_MF_AUTHENT, [mode, addr] + sect + ser[:4])[0]
+    return self._tocard(_CMD_MF_AUTHENT, bytes([mode, addr]) + bytes(sect) + bytes(ser[:4]))[0]
 
 # Required for Classic Tag only - Turn off crypto
 def _classicStopCrypto(self):